@@ -1,9 +1,14 @@
 import fsspec
-import inspect
 import yaml
 import os
 from typing import Optional, Union, Sequence, List
 
+try:
+    # use the libyaml bindings when available, they are much faster
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper  # type: ignore
+
 
 DELP = "pressure_thickness_of_atmospheric_layer"
 MODEL_CONFIG_FILENAME = "training_config.yml"
@@ -76,24 +81,21 @@ class ModelTrainingConfig:
         self.model_path = model_path
 
     def asdict(self):
-        attributes = inspect.getmembers(self, lambda a: not (inspect.isroutine(a)))
-        return {
-            key: value
-            for key, value in attributes
-            if not (key.startswith("__") and key.endswith("__"))
-        }
+        # all configuration is stored as instance attributes, so read them
+        # directly instead of introspecting every member of the class
+        return dict(vars(self))
 
     def dump(self, path: str, filename: str = None) -> None:
         dict_ = self.asdict()
         if filename is None:
             filename = MODEL_CONFIG_FILENAME
         with fsspec.open(os.path.join(path, filename), "w") as f:
-            yaml.safe_dump(dict_, f)
+            yaml.dump(dict_, f, Dumper=SafeDumper)
 
     @classmethod
     def load(cls, path: str) -> "ModelTrainingConfig":
         with fsspec.open(path, "r") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=SafeLoader)
         return ModelTrainingConfig(**config_dict)
 
 
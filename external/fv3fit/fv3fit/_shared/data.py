@@ -1,13 +1,15 @@
-from typing import List, Union
+from typing import List, Union, TYPE_CHECKING
 import xarray as xr
 
-from loaders import batches, Map
 from .config import ModelTrainingConfig
 
+if TYPE_CHECKING:
+    from loaders import Map
+
 
 def load_data_sequence(
     data_path: Union[List, tuple, str], train_config: ModelTrainingConfig
-) -> Map[xr.Dataset]:
+) -> "Map[xr.Dataset]":
     """
     Args:
         data_path: data location
@@ -16,6 +18,10 @@ def load_data_sequence(
     Returns:
         Sequence of datasets iterated over in training
     """
+    # imported here so that importing fv3fit does not import loaders, which is
+    # only needed when loading training data
+    from loaders import batches
+
     batch_function = getattr(batches, train_config.batch_function)
     ds_batches = batch_function(
         data_path,
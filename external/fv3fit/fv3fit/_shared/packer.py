@@ -13,6 +13,9 @@ import xarray as xr
 import pandas as pd
 import yaml
 
+# target size in bytes of the block of packed samples written at a time
+_PACK_BLOCK_BYTES = 2 ** 20
+
 
 def _feature_dims(data: xr.Dataset, sample_dim: str) -> Sequence[str]:
     return [str(dim) for dim in data.dims.keys() if dim != sample_dim]
@@ -34,24 +37,80 @@ def _unique_dim_name(
     return feature_dim_name
 
 
+def _concatenate_level(parts: Sequence[np.ndarray]) -> np.ndarray:
+    if all(np.issubdtype(part.dtype, np.number) for part in parts):
+        return np.concatenate(parts)
+    else:
+        # avoid numpy casting NaN fill values to strings
+        return np.concatenate([part.astype(object) for part in parts])
+
+
 def pack(data: xr.Dataset, sample_dim: str) -> Tuple[np.ndarray, pd.MultiIndex]:
+    """Pack a dataset into a 2D [sample, feature] array.
+
+    Equivalent to ``data.to_stacked_array(...)``, but concatenates the variables
+    directly with numpy rather than building an intermediate stacked DataArray.
+
+    Returns:
+        array: 2D [sample, feature] array
+        feature_index: index with a "variable" level and one level per
+            non-sample dimension, as produced by ``to_stacked_array``
+    """
     feature_dim_name = _unique_dim_name(data, sample_dim)
-    stacked = data.to_stacked_array(feature_dim_name, sample_dims=[sample_dim])
-    return (
-        stacked.transpose(sample_dim, feature_dim_name).data,
-        stacked.indexes[feature_dim_name],
+    feature_dims = _feature_dims(data, sample_dim)
+    arrays = []
+    levels: Dict[str, List[np.ndarray]] = {
+        dim: [] for dim in ["variable", *feature_dims]
+    }
+    for name, value in data.data_vars.items():
+        value_feature_dims = [dim for dim in feature_dims if dim in value.dims]
+        array = value.transpose(sample_dim, *value_feature_dims).values
+        n_features = int(np.prod(array.shape[1:]))
+        arrays.append(array.reshape(array.shape[0], n_features))
+        coords = np.meshgrid(
+            *[data[dim].values for dim in value_feature_dims], indexing="ij"
+        )
+        levels["variable"].append(np.full(n_features, name, dtype=object))
+        for dim in feature_dims:
+            if dim in value_feature_dims:
+                levels[dim].append(coords[value_feature_dims.index(dim)].ravel())
+            else:
+                # to_stacked_array fills dimensions a variable lacks with NaN
+                levels[dim].append(np.full(n_features, np.nan))
+    feature_index = pd.MultiIndex.from_arrays(
+        [_concatenate_level(parts) for parts in levels.values()], names=list(levels)
     )
+    feature_index.name = feature_dim_name
+    return np.concatenate(arrays, axis=1), feature_index
 
 
 def unpack(
     data: np.ndarray, sample_dim: str, feature_index: pd.MultiIndex
 ) -> xr.Dataset:
+    """Unpack a 2D [sample, feature] array created by ``pack`` into a dataset.
+
+    Splits the array directly using the feature index, rather than building
+    a stacked DataArray and calling ``to_unstacked_dataset``. Unlike
+    ``to_unstacked_dataset``, length-1 sample and feature dimensions are kept
+    rather than squeezed out.
+    """
     if len(data.shape) == 1:
         data = data[:, None]
-    da = xr.DataArray(
-        data, dims=[sample_dim, "feature"], coords={"feature": feature_index}
-    )
-    return da.to_unstacked_dataset("feature")
+    variables = feature_index.get_level_values(0)
+    data_vars = {}
+    for name in feature_index.levels[0]:
+        columns = np.flatnonzero(variables == name)
+        dims, coords, shape = [sample_dim], {}, [data.shape[0]]
+        for dim in feature_index.names[1:]:
+            values = feature_index.get_level_values(dim)[columns]
+            if not values.isna().all():
+                coords[dim] = values.unique()
+                dims.append(dim)
+                shape.append(len(coords[dim]))
+        data_vars[name] = xr.DataArray(
+            data[:, columns].reshape(shape), dims=dims, coords=coords
+        )
+    return xr.Dataset(data_vars)
 
 
 class ArrayPacker:
@@ -91,7 +150,7 @@ class ArrayPacker:
     def _total_features(self):
         return sum(self._n_features[name] for name in self._pack_names)
 
-    def to_array(self, dataset: xr.Dataset) -> np.ndarray:
+    def to_array(self, dataset: xr.Dataset, order: str = "C") -> np.ndarray:
         """Convert dataset into a 2D array with [sample, feature] dimensions.
 
         Variable names inserted into the array are passed on initialization of this
@@ -109,6 +168,9 @@ class ArrayPacker:
         
         Args:
             dataset: dataset containing variables in self.pack_names to pack
+            order: memory layout of the returned array, "C" (row-major) or
+                "F" (column-major). Column-major output suits consumers which
+                reduce over each feature, such as some scikit-learn estimators.
 
         Returns:
             array: 2D [sample, feature] array with data from the dataset
@@ -119,10 +181,16 @@ class ArrayPacker:
             )
             for name in self.pack_names:
                 self._dims[name] = cast(Tuple[str], dataset[name].dims)
+        arrays = {}
         for var in self.pack_names:
-            if dataset[var].dims[0] != self.sample_dim_name:
-                dataset[var] = dataset[var].transpose()
-        array = _to_array_2d(dataset, self.pack_names, self.feature_counts)
+            value = dataset.variables[var]
+            if value.dims[0] != self.sample_dim_name:
+                # transposing the numpy array is a view, and leaves the
+                # caller's dataset unmodified
+                arrays[var] = value.values.T
+            else:
+                arrays[var] = value.values
+        array = _to_array_2d(arrays, self.pack_names, self._n_features, order)
         return array
 
     def to_dataset(self, array: np.ndarray) -> xr.Dataset:
@@ -145,7 +213,7 @@ class ArrayPacker:
                 "must pack at least once before unpacking, "
                 "so dimension lengths are known"
             )
-        return to_dataset(array, self.pack_names, self._dims, self.feature_counts)
+        return to_dataset(array, self.pack_names, self._dims, self._n_features)
 
     def dump(self, f: TextIO):
         return yaml.safe_dump(
@@ -168,37 +236,59 @@ class ArrayPacker:
 
 
 def _to_array_2d(
-    dataset: xr.Dataset, pack_names: Sequence[str], feature_counts: Mapping[str, int],
+    arrays: Mapping[str, np.ndarray],
+    pack_names: Sequence[str],
+    feature_counts: Mapping[str, int],
+    order: str = "C",
 ):
     """
-    Convert dataset into a 2D array with [sample, feature] dimensions.
+    Convert arrays into a 2D array with [sample, feature] dimensions.
 
     The first dimension of each variable to pack is assumed to be the sample dimension,
     and the second (if it exists) is assumed to be the feature dimension.
     Each variable must be 1D or 2D.
     
     Args:
-        dataset: dataset containing variables in self.pack_names to pack
+        arrays: mapping containing arrays for each variable in pack_names
         pack_names: names of variables to pack
         feature_counts: number of features for each variable
+        order: memory layout of the returned array, "C" or "F"
 
     Returns:
         array: 2D [sample, feature] array with data from the dataset
     """
     # we can assume here that the first dimension is the sample dimension
-    n_samples = dataset[pack_names[0]].shape[0]
+    n_samples = arrays[pack_names[0]].shape[0]
     total_features = sum(feature_counts[name] for name in pack_names)
+    # pack at the precision of floating point data, rather than upcasting to
+    # float64, but keep packing integer and boolean data as float64
+    dtype = np.result_type(*[arrays[name].dtype for name in pack_names])
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.float64
 
-    array = np.empty([n_samples, total_features])
+    array = np.empty([n_samples, total_features], dtype=dtype, order=order)
 
-    i_start = 0
-    for name in pack_names:
-        n_features = feature_counts[name]
-        if n_features > 1:
-            array[:, i_start : i_start + n_features] = dataset[name]
-        else:
-            array[:, i_start] = dataset[name]
-        i_start += n_features
+    if order == "F":
+        # each variable's columns are already contiguous, so copy them whole
+        block_size = max(1, n_samples)
+    else:
+        # copy in blocks of samples, so that the rows of the output being written
+        # stay in cache while every variable is copied into them
+        row_bytes = array.itemsize * total_features
+        block_size = max(1, _PACK_BLOCK_BYTES // max(1, row_bytes))
+    for block_start in range(0, n_samples, block_size):
+        block = slice(block_start, block_start + block_size)
+        i_start = 0
+        for name in pack_names:
+            n_features = feature_counts[name]
+            source = arrays[name]
+            if source.shape[0] == n_samples:
+                source = source[block]
+            if n_features > 1:
+                array[block, i_start : i_start + n_features] = source
+            else:
+                array[block, i_start] = source
+            i_start += n_features
     return array
 
 
@@ -244,16 +334,16 @@ def _count_features_2d(
     """
     count features for (sample[, z]) arrays
     """
-    for name in quantity_names:
-        if len(dataset[name].dims) > 2:
-            value = dataset[name]
+    # dataset.variables avoids constructing a new DataArray for each lookup
+    variables = {name: dataset.variables[name] for name in quantity_names}
+    for name, value in variables.items():
+        if len(value.dims) > 2:
             raise ValueError(
                 "can only pack 1D/2D (sample[, z]) "
                 f"variables, recieved value for {name} with dimensions {value.dims}"
             )
     return_dict = {}
-    for name in quantity_names:
-        value = dataset[name]
+    for name, value in variables.items():
         if len(value.dims) == 1 and value.dims[0] == sample_dim_name:
             return_dict[name] = 1
         elif value.dims[0] != sample_dim_name:
@@ -279,18 +369,21 @@ def unpack_matrix(
         a Dataset
 
     """
-    jacobian_dict = {}
-    j = 0
-    for in_name in x_packer.pack_names:
-        i = 0
-        for out_name in y_packer.pack_names:
-            size_in = x_packer.feature_counts[in_name]
-            size_out = y_packer.feature_counts[out_name]
+    # feature_counts returns a copy, so only access it once per packer
+    in_counts = x_packer.feature_counts
+    out_counts = y_packer.feature_counts
+    in_splits = np.cumsum([in_counts[name] for name in x_packer.pack_names])[:-1]
+    out_splits = np.cumsum([out_counts[name] for name in y_packer.pack_names])[:-1]
 
+    jacobian_dict = {}
+    for in_name, column_block in zip(
+        x_packer.pack_names, np.split(matrix, in_splits, axis=1)
+    ):
+        for out_name, block in zip(
+            y_packer.pack_names, np.split(column_block, out_splits, axis=0)
+        ):
             jacobian_dict[(in_name, out_name)] = xr.DataArray(
-                matrix[i : i + size_out, j : j + size_in], dims=[out_name, in_name],
+                block, dims=[out_name, in_name]
             )
-            i += size_out
-        j += size_in
 
     return xr.Dataset(jacobian_dict)  # type: ignore
@@ -84,11 +84,9 @@ class Predictor(abc.ABC):
 
         # ensure the output coords are the same
         # stack/unstack adds coordinates if none exist before
-        for key in output.coords:
-            if key in coords:
-                output.coords[key] = coords[key]
-            else:
-                del output.coords[key]
+        # drop and assign in one call each, rather than updating per coordinate
+        output = output.drop_vars([key for key in output.coords if key not in coords])
+        output = output.assign_coords({key: coords[key] for key in output.coords})
 
         # ensure dimension order is the same
         dim_order = [
@@ -116,8 +114,9 @@ class Estimator(Predictor):
 def _infer_dimension_order(ds: xr.Dataset) -> Tuple:
     # add check here for cases when the dimension order is inconsistent between arrays?
     dim_order = []
-    for variable in ds:
-        for dim in ds[variable].dims:
+    for variable in ds.data_vars:
+        # ds.variables avoids constructing a DataArray for each variable
+        for dim in ds.variables[variable].dims:
             if dim not in dim_order:
                 dim_order.append(dim)
     return tuple(dim_order)
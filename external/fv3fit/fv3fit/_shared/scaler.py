@@ -41,7 +41,7 @@ class StandardScaler(NormalizeTransform):
 
     kind: str = "standard"
 
-    def __init__(self, std_epsilon: np.float64 = 1e-12):
+    def __init__(self, std_epsilon: np.float64 = 1e-12, dtype=None):
         """Standard scaler normalizer: normalizes via (x-mean)/std
 
         Args:
@@ -49,24 +49,41 @@ class StandardScaler(NormalizeTransform):
                 of each variable to be scaled, such that no variables (even those
                 that are constant across samples) are unable to be scaled due to
                 having zero standard deviation. Defaults to 1e-12.
+            dtype: dtype in which to store the mean and standard deviation.
+                By default, uses the dtype of floating point data passed to
+                fit, so that normalizing does not upcast the data. Pass
+                np.float64 to always store double precision statistics.
         """
         self.mean = None
         self.std = None
         self.std_epsilon: np.float64 = std_epsilon
+        self.dtype = dtype
 
     def fit(self, data: np.ndarray):
-        self.mean = data.mean(axis=0).astype(np.float64)
-        self.std = data.std(axis=0).astype(np.float64) + self.std_epsilon
+        if self.dtype is not None:
+            dtype = self.dtype
+        elif np.issubdtype(data.dtype, np.floating):
+            dtype = data.dtype
+        else:
+            dtype = np.float64
+        self.mean = data.mean(axis=0).astype(dtype)
+        self.std = (data.std(axis=0) + self.std_epsilon).astype(dtype)
 
     def normalize(self, data):
         if self.mean is None or self.std is None:
             raise RuntimeError("StandardScaler.fit must be called before normalize.")
-        return (data - self.mean) / self.std
+        # divide in place to avoid allocating a second full-size temporary,
+        # augmented assignment falls back to a new object for tensors
+        normed = data - self.mean
+        normed /= self.std
+        return normed
 
     def denormalize(self, data):
         if self.mean is None or self.std is None:
             raise RuntimeError("StandardScaler.fit must be called before denormalize.")
-        return data * self.std + self.mean
+        denormed = data * self.std
+        denormed += self.mean
+        return denormed
 
     def dump(self, f: BinaryIO):
         data = {}  # type: ignore
@@ -92,11 +109,13 @@ class ManualScaler(NormalizeTransform):
     def __init__(self, scales):
         self.scales = scales
 
-    def normalize(self, y: np.ndarray):
-        return y * self.scales
+    def normalize(self, y: np.ndarray, out: np.ndarray = None):
+        """Scale y, writing into out if given. Pass out=y to scale in place."""
+        return np.multiply(y, self.scales, out=out)
 
-    def denormalize(self, y: np.ndarray):
-        return y / self.scales
+    def denormalize(self, y: np.ndarray, out: np.ndarray = None):
+        """Unscale y, writing into out if given. Pass out=y to unscale in place."""
+        return np.divide(y, self.scales, out=out)
 
     def dump(self, f: BinaryIO):
         data = {}
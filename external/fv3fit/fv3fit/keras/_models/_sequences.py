@@ -1,3 +1,4 @@
+import functools
 import logging
 import threading
 import queue
@@ -15,6 +16,10 @@ class _XyArraySequence(tf.keras.utils.Sequence):
     """
     Wrapper object converting a sequence of batch datasets
     to a sequence of input/output numpy arrays.
+
+    If cache_size is nonzero, up to that many packed batches are kept in
+    memory so later epochs do not re-pack them. The cached arrays are
+    shared between calls and must not be modified in place.
     """
 
     def __init__(
@@ -22,15 +27,24 @@ class _XyArraySequence(tf.keras.utils.Sequence):
         X_packer: ArrayPacker,
         y_packer: ArrayPacker,
         dataset_sequence: Sequence[xr.Dataset],
+        cache_size: int = 0,
     ):
         self.X_packer = X_packer
         self.y_packer = y_packer
         self.dataset_sequence = dataset_sequence
+        if cache_size > 0:
+            cache = functools.lru_cache(maxsize=cache_size)
+            self._get_arrays = cache(self._get_arrays)  # type: ignore
 
     def __len__(self) -> int:
         return len(self.dataset_sequence)
 
     def __getitem__(self, idx) -> Tuple[np.ndarray, np.ndarray]:
+        if idx < 0:
+            idx += len(self)
+        return self._get_arrays(idx)
+
+    def _get_arrays(self, idx: int) -> Tuple[np.ndarray, np.ndarray]:
         ds = self.dataset_sequence[idx]
         X = self.X_packer.to_array(ds)
         y = self.y_packer.to_array(ds)
@@ -71,7 +85,7 @@ class _ThreadedSequencePreLoader(tf.keras.utils.Sequence):
     def __iter__(self):
 
         init_q = queue.Queue()
-        for idx in list(range(len(self))):
+        for idx in range(len(self)):
             init_q.put(idx)
 
         event = threading.Event()
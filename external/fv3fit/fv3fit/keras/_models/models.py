@@ -17,7 +17,6 @@ from ._filesystem import get_dir, put_dir
 from ._sequences import _XyArraySequence, _ThreadedSequencePreLoader
 from .normalizer import LayerStandardScaler
 from .loss import get_weighted_mse, get_weighted_mae
-from loaders.batches import Take, shuffle
 import yaml
 
 logger = logging.getLogger(__file__)
@@ -143,6 +142,7 @@ class PackedKerasModel(Estimator):
         max_queue_size: Optional[int] = None,
         validation_samples: Optional[int] = None,
         use_last_batch_to_validate: Optional[bool] = None,
+        cache_size: Optional[int] = None,
     ) -> None:
         """Fits a model using data in the batches sequence
         
@@ -172,6 +172,9 @@ class PackedKerasModel(Estimator):
             use_last_batch_to_validate: if True, use the last batch as a validation
                 dataset, cannot be used with a non-None value for validation_dataset.
                 Defaults to False.
+            cache_size: number of packed batches to keep in memory, so that
+                later epochs do not re-pack them from the batch datasets.
+                Defaults to 0 (no caching).
         """
 
         fit_kwargs = copy.copy(self._fit_kwargs)
@@ -185,8 +188,14 @@ class PackedKerasModel(Estimator):
         fit_kwargs = _fill_default(
             fit_kwargs, use_last_batch_to_validate, "use_last_batch_to_validate", False
         )
+        fit_kwargs = _fill_default(fit_kwargs, cache_size, "cache_size", 0)
 
-        Xy = _XyArraySequence(self.X_packer, self.y_packer, batches)
+        Xy = _XyArraySequence(
+            self.X_packer,
+            self.y_packer,
+            batches,
+            cache_size=fit_kwargs.pop("cache_size"),
+        )
 
         if self._model is None:
             X, y = Xy[0]
@@ -219,6 +228,8 @@ class PackedKerasModel(Estimator):
             X_val = X_val[val_sample, :]
             y_val = y_val[val_sample, :]
             validation_data = (X_val, y_val)
+            from loaders.batches import Take
+
             Xy = Take(Xy, len(Xy) - 1)  # type: ignore
         elif validation_dataset is not None:
             X_val = self.X_packer.to_array(validation_dataset)
@@ -244,6 +255,8 @@ class PackedKerasModel(Estimator):
         last_batch_validation_fraction: float = 1.0,
         **fit_kwargs,
     ) -> None:
+        # imported here so that importing fv3fit does not import loaders
+        from loaders.batches import shuffle
 
         for i_epoch in range(epochs):
             Xy = shuffle(Xy)
@@ -27,20 +27,10 @@ class Unpack(tf.keras.layers.Layer):
         self.feature_dim = feature_dim
         if feature_dim not in (1, 2):
             raise NotImplementedError(self.feature_dim)
+        self._sizes = [n_features[name] for name in pack_names]
 
     def call(self, inputs):
-        i = 0
-        return_tensors = []
-        for name in self.pack_names:
-            features = self.n_features[name]
-            if self.feature_dim == 1:
-                return_tensors.append(inputs[:, i : i + features])
-            elif self.feature_dim == 2:
-                return_tensors.append(inputs[:, :, i : i + features])
-            else:
-                raise NotImplementedError(self.feature_dim)
-            i += features
-        return return_tensors
+        return tf.split(inputs, self._sizes, axis=self.feature_dim)
 
     def get_config(self):
         return {
@@ -1,4 +1,5 @@
 from typing import Dict, Any, Iterable, Hashable, Optional, Sequence, Tuple, List
+import logging
 import tensorflow as tf
 import xarray as xr
 import os
@@ -10,6 +11,8 @@ import yaml
 import numpy as np
 import vcm.safe
 
+logger = logging.getLogger(__name__)
+
 Z_DIMS = ["z", "z_interface"]
 
 
@@ -711,7 +714,7 @@ class StepwiseModel(PureKerasModel):
         state_out_list = []
         n_timesteps = len(ds["time"]) - 1
         for i in range(n_timesteps):
-            print(f"Step {i+1} of {n_timesteps}")
+            logger.debug("Step %d of %d", i + 1, n_timesteps)
             input_ds = ds.isel(time=i)
             _update_ds_with_state(input_ds, state, self.sample_dim_name)
             tendency_ds = self.predict(input_ds)
@@ -52,8 +52,10 @@ class DummyModel(Estimator):
         batch_size: Optional[int] = None,
         **fit_kwargs: Any
     ) -> None:
-        # this is all we need to do to learn n output feature
-        _, _ = _XyArraySequence(self.X_packer, self.y_packer, batches)[0]
+        # this is all we need to do to learn n output feature, and a single
+        # sample is enough to count features without packing the whole batch
+        batch = batches[0].isel({self.sample_dim_name: slice(0, 1)})
+        _, _ = _XyArraySequence(self.X_packer, self.y_packer, [batch])[0]
 
     def predict(self, X: xr.Dataset) -> xr.Dataset:
         if not self.y_packer._n_features:
@@ -8,8 +8,10 @@ from .._shared import ModelTrainingConfig, load_data_sequence
 def check_validation_train_overlap(
     train: Sequence[str], validate: Sequence[str]
 ) -> None:
-    overlap = set(train) & set(validate)
-    if overlap:
+    train_set = frozenset(train)
+    # only build the overlap set if there is an overlap to report
+    if any(timestep in train_set for timestep in validate):
+        overlap = {timestep for timestep in validate if timestep in train_set}
         raise ValueError(
             f"Timestep(s) {overlap} are in both train and validation sets."
         )
@@ -17,10 +19,13 @@ def check_validation_train_overlap(
 
 def validation_timesteps_config(train_config: ModelTrainingConfig):
     val_config = copy(train_config)
-    val_config.batch_kwargs["timesteps"] = train_config.validation_timesteps
-    val_config.batch_kwargs["timesteps_per_batch"] = len(
-        train_config.validation_timesteps  # type: ignore
-    )
+    # build the validation batch kwargs in one pass, rather than updating the
+    # dict shared with the training config through the shallow copy
+    val_config.batch_kwargs = {
+        **train_config.batch_kwargs,
+        "timesteps": train_config.validation_timesteps,
+        "timesteps_per_batch": len(train_config.validation_timesteps),  # type: ignore
+    }
     return val_config
 
 
@@ -3,6 +3,7 @@ import inspect
 import loaders
 import logging
 import os
+from typing import Sequence
 import yaml
 
 from ._shared import (
@@ -12,6 +13,7 @@ from ._shared import (
     io,
     Estimator,
 )
+from ._shared.config import SafeLoader
 from .keras._training import get_regularizer, get_optimizer, set_random_seed
 from .keras._validation_data import validation_dataset
 import fv3fit.keras
@@ -62,6 +64,11 @@ def get_parser():
     return parser
 
 
+def _load_timesteps(path: str) -> Sequence[str]:
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def _get_model(config: ModelTrainingConfig) -> Estimator:
     routine = ROUTINE_LOOKUP[config.model_type]
     if routine == "sklearn":
@@ -111,14 +118,12 @@ if __name__ == "__main__":
     train_config.data_path = args.data_path
 
     if args.timesteps_file:
-        with open(args.timesteps_file, "r") as f:
-            timesteps = yaml.safe_load(f)
+        timesteps = _load_timesteps(args.timesteps_file)
         train_config.batch_kwargs["timesteps"] = timesteps
         train_config.timesteps_source = "timesteps_file"
 
     if args.validation_timesteps_file:
-        with open(args.validation_timesteps_file, "r") as f:
-            val_timesteps = yaml.safe_load(f)
+        val_timesteps = _load_timesteps(args.validation_timesteps_file)
         train_config.validation_timesteps = val_timesteps
 
     train_config.dump(args.output_data_path)
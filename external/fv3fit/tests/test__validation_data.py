@@ -1,5 +1,9 @@
 import pytest
-from fv3fit.keras._validation_data import check_validation_train_overlap
+from fv3fit._shared.config import ModelTrainingConfig
+from fv3fit.keras._validation_data import (
+    check_validation_train_overlap,
+    validation_timesteps_config,
+)
 
 
 def test_check_validation_train_overlap():
@@ -8,3 +12,25 @@ def test_check_validation_train_overlap():
     check_validation_train_overlap(*no_overlap)
     with pytest.raises(ValueError):
         check_validation_train_overlap(*overlap)
+
+
+def test_validation_timesteps_config_does_not_modify_train_config():
+    train_config = ModelTrainingConfig(
+        model_type="great_model",
+        hyperparameters={},
+        input_variables=["in0"],
+        output_variables=["out0"],
+        batch_function="batches_from_mapper",
+        batch_kwargs={"timesteps": ["20160801.000000"], "timesteps_per_batch": 1},
+        validation_timesteps=["20160802.000000", "20160803.000000"],
+    )
+    val_config = validation_timesteps_config(train_config)
+    assert val_config.batch_kwargs["timesteps"] == [
+        "20160802.000000",
+        "20160803.000000",
+    ]
+    assert val_config.batch_kwargs["timesteps_per_batch"] == 2
+    assert train_config.batch_kwargs == {
+        "timesteps": ["20160801.000000"],
+        "timesteps_per_batch": 1,
+    }
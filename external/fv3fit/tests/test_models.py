@@ -3,7 +3,11 @@ import numpy as np
 
 import pytest
 
-from fv3fit.keras._models._sequences import _ThreadedSequencePreLoader
+from fv3fit._shared.packer import ArrayPacker
+from fv3fit.keras._models._sequences import (
+    _ThreadedSequencePreLoader,
+    _XyArraySequence,
+)
 from fv3fit.keras._models.models import PackedKerasModel, _fill_default
 import tensorflow.keras
 
@@ -18,6 +22,50 @@ def test__ThreadedSequencePreLoader():
         assert item in sequence
 
 
+@pytest.mark.parametrize("cache_size", [0, 2])
+def test__XyArraySequence_cache(cache_size):
+    batches = [
+        xr.Dataset(
+            {"a": (["x"], np.full(3, float(i))), "b": (["x"], np.full(3, -float(i)))}
+        )
+        for i in range(3)
+    ]
+    X_packer = ArrayPacker("x", ["a"])
+    y_packer = ArrayPacker("x", ["b"])
+    sequence = _XyArraySequence(X_packer, y_packer, batches, cache_size=cache_size)
+    for idx in [0, 1, -1, 2]:
+        X, y = sequence[idx]
+        np.testing.assert_array_equal(X[:, 0], batches[idx]["a"].values)
+        np.testing.assert_array_equal(y[:, 0], batches[idx]["b"].values)
+    assert (sequence[-1][0] is sequence[2][0]) == (cache_size > 0)
+
+
+@pytest.mark.parametrize(
+    "fit_kwargs, cache_size, expect_cached",
+    [({}, None, False), ({}, 2, True), ({"cache_size": 2}, None, True),],
+)
+def test_PackedKerasModel_fit_cache_size(fit_kwargs, cache_size, expect_cached):
+    class IdentityModel(PackedKerasModel):
+        def get_model(self, n, m):
+            x = tensorflow.keras.Input(shape=[n])
+            model = tensorflow.keras.Model(inputs=[x], outputs=[x])
+            model.compile()
+            return model
+
+    fit_loop_calls = []
+
+    def fit_loop(Xy, validation_data, **kwargs):
+        fit_loop_calls.append((Xy, kwargs))
+
+    batch = xr.Dataset({"a": (["x"], np.arange(3.0)), "b": (["x"], np.arange(3.0))})
+    model = IdentityModel("x", ["a"], ["b"], fit_kwargs=fit_kwargs)
+    model._fit_loop = fit_loop
+    model.fit([batch], cache_size=cache_size)
+    [(Xy, kwargs)] = fit_loop_calls
+    assert "cache_size" not in kwargs
+    assert (Xy[0][0] is Xy[0][0]) == expect_cached
+
+
 @pytest.mark.parametrize("base_state", ["manual", "default"])
 def test_PackedKerasModel_jacobian(base_state):
     class IdentityModel(PackedKerasModel):
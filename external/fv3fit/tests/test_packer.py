@@ -1,3 +1,4 @@
+import fv3fit._shared.packer
 from fv3fit._shared import ArrayPacker
 from typing import Iterable
 from fv3fit._shared.packer import (
@@ -93,6 +94,50 @@ def test_to_array(names, dims_list, array: np.ndarray):
     np.testing.assert_array_equal(result, array)
 
 
+def test_to_array_in_blocks(names, dims_list, array: np.ndarray, monkeypatch):
+    monkeypatch.setattr(fv3fit._shared.packer, "_PACK_BLOCK_BYTES", 100)
+    dataset = get_dataset(names, dims_list)
+    packer = ArrayPacker(SAMPLE_DIM, names)
+    result = packer.to_array(dataset)
+    np.testing.assert_array_equal(result, array)
+
+
+def test_to_array_fortran_order(names, dims_list, array: np.ndarray):
+    dataset = get_dataset(names, dims_list)
+    packer = ArrayPacker(SAMPLE_DIM, names)
+    result = packer.to_array(dataset, order="F")
+    assert result.flags.f_contiguous
+    np.testing.assert_array_equal(result, array)
+
+
+@pytest.mark.parametrize(
+    "dtype, expected_dtype",
+    [
+        pytest.param(np.float32, np.float32, id="float32"),
+        pytest.param(np.float64, np.float64, id="float64"),
+        pytest.param(np.int32, np.float64, id="int32"),
+        pytest.param(np.bool_, np.float64, id="bool"),
+    ],
+)
+def test_to_array_preserves_dtype(names, dims_list, dtype, expected_dtype):
+    dataset = get_dataset(names, dims_list).astype(dtype)
+    packer = ArrayPacker(SAMPLE_DIM, names)
+    result = packer.to_array(dataset)
+    assert result.dtype == expected_dtype
+
+
+def test_to_array_does_not_modify_dataset():
+    dataset = xr.Dataset(
+        {"a": ([FEATURE_DIM, SAMPLE_DIM], np.arange(6.0).reshape(2, 3))}
+    )
+    expected = dataset.copy(deep=True)
+    packer = ArrayPacker(SAMPLE_DIM, ["a"])
+    packer.to_array(dataset.transpose())  # must pack first to know dimension lengths
+    result = packer.to_array(dataset)
+    np.testing.assert_array_equal(result, dataset["a"].values.T)
+    xr.testing.assert_identical(dataset, expected)
+
+
 def test_to_dataset(names, dims_list, array: np.ndarray):
     dataset = get_dataset(names, dims_list)
     packer = ArrayPacker(SAMPLE_DIM, names)
@@ -189,6 +234,23 @@ def test_sklearn_unpack(dataset: xr.Dataset):
     xr.testing.assert_allclose(unpacked_dataset, dataset)
 
 
+@pytest.mark.parametrize("n_samples", [1, 3])
+def test_sklearn_unpack_keeps_length_one_dims(n_samples):
+    dataset = xr.Dataset(
+        {
+            "a": (["sample", "z"], np.arange(n_samples, dtype=float)[:, None]),
+            "b": (["sample"], np.arange(n_samples, dtype=float)),
+        }
+    )
+    packed_array, feature_index = pack(dataset, "sample")
+    unpacked_dataset = unpack(packed_array, "sample", feature_index)
+    assert unpacked_dataset["a"].dims == ("sample", "z")
+    assert unpacked_dataset["a"].shape == (n_samples, 1)
+    assert unpacked_dataset["b"].dims == ("sample",)
+    np.testing.assert_array_equal(unpacked_dataset["a"], dataset["a"])
+    np.testing.assert_array_equal(unpacked_dataset["b"], dataset["b"])
+
+
 def test_count_features_2d():
     SAMPLE_DIM_NAME = "axy"
     ds = xr.Dataset(
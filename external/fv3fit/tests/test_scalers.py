@@ -43,6 +43,22 @@ def test_standard_scaler_constant_scaling(std_epsilon):
     assert denormed_sample[2] == const * 2.0
 
 
+@pytest.mark.parametrize(
+    "data_dtype, scaler_dtype, expected_dtype",
+    [
+        (np.float32, None, np.float32),
+        (np.float64, None, np.float64),
+        (np.int64, None, np.float64),
+        (np.float32, np.float64, np.float64),
+    ],
+)
+def test_standard_scaler_statistics_dtype(data_dtype, scaler_dtype, expected_dtype):
+    scaler = StandardScaler(dtype=scaler_dtype)
+    scaler.fit(np.arange(10).reshape(5, 2).astype(data_dtype))
+    assert scaler.mean.dtype == expected_dtype
+    assert scaler.std.dtype == expected_dtype
+
+
 @pytest.mark.parametrize("n_samples, n_features", [(10, 1), (10, 5)])
 def test_standard_scaler_normalize_then_denormalize(n_samples, n_features):
     scaler = StandardScaler()
@@ -167,6 +183,18 @@ def test_weight_scaler_normalize():
     np.testing.assert_almost_equal(result, [[0.0, 1.0, 2.0, 3.0]])
 
 
+def test_weight_scaler_in_place():
+    y = np.array([[0.0, 0.01, 2.0, 1.5]])
+    weights = np.array([[1.0, 100.0, 1.0, 2.0]])
+    scaler = ManualScaler(weights)
+    result = scaler.normalize(y, out=y)
+    assert result is y
+    np.testing.assert_almost_equal(y, [[0.0, 1.0, 2.0, 3.0]])
+    result = scaler.denormalize(y, out=y)
+    assert result is y
+    np.testing.assert_almost_equal(y, [[0.0, 0.01, 2.0, 1.5]])
+
+
 def test_weight_scaler_normalize_then_denormalize_on_reloaded_scaler():
     np.random.seed(SEED)
     y = np.random.uniform(0, 10, 10)
@@ -1,4 +1,6 @@
+import functools
 import numpy as np
+import pandas as pd
 from numpy.random import RandomState
 from typing import Tuple, Sequence
 from toolz.functoolz import curry
@@ -34,8 +36,9 @@ K = Tuple[Time, Tile]
 
 
 def nonderived_variables(requested: Sequence[str], available: Sequence[str]):
-    derived = [var for var in requested if var not in available]
-    nonderived = [var for var in requested if var in available]
+    available_set = set(available)
+    derived = {var for var in requested if var not in available_set}
+    nonderived = [var for var in requested if var in available_set]
     # if E/N winds not in underlying data, need to load x/y wind
     # tendencies to derive them
     if any(var in derived for var in EAST_NORTH_WIND_TENDENCIES):
@@ -84,6 +87,9 @@ def add_wind_rotation_info(res: str, ds: xr.Dataset) -> xr.Dataset:
     return ds.merge(rotation, compat="override")
 
 
+# the grid data are read-only and identical for every batch at a resolution,
+# so only open them from the catalog once
+@functools.lru_cache(maxsize=4)
 def _load_grid(res: str) -> xr.Dataset:
     grid = catalog[f"grid/{res}"].to_dask()
     land_sea_mask = catalog[f"landseamask/{res}"].to_dask()
@@ -92,6 +98,7 @@ def _load_grid(res: str) -> xr.Dataset:
     return safe.get_variables(grid, ["lat", "lon", "land_sea_mask"]).drop("tile")
 
 
+@functools.lru_cache(maxsize=4)
 def _load_wind_rotation_matrix(res: str) -> xr.Dataset:
     rotation = catalog[f"wind_rotation/{res}"].to_dask()
     return safe.get_variables(rotation, WIND_ROTATION_COEFFICIENTS)
@@ -113,9 +120,22 @@ def standardize_zarr_time_coord(ds: xr.Dataset) -> xr.Dataset:
     Returns:
         xr.Dataset with standardized time coordinates
     """
-    # Vectorize doesn't work on type-dispatched function overloading
-    times = np.array(list(map(vcm.cast_to_datetime, ds[TIME_NAME].values)))
-    times = round_time(times)
+    times = ds[TIME_NAME].values
+    if not np.issubdtype(times.dtype, np.datetime64):
+        # Vectorize doesn't work on type-dispatched function overloading
+        times = [vcm.cast_to_datetime(time) for time in times]
+    try:
+        nanoseconds = pd.to_datetime(times).asi8
+    except pd.errors.OutOfBoundsDatetime:
+        # times outside the datetime64[ns] range (e.g. year 1) are rounded
+        # per python datetime object instead
+        times = round_time(np.array(times))
+    else:
+        # round in integer nanoseconds rather than per python datetime object
+        seconds, remainder = np.divmod(nanoseconds, 10 ** 9)
+        # round half down, matching vcm.convenience.round_time
+        seconds += remainder > 5 * 10 ** 8
+        times = seconds.astype("datetime64[s]").astype("datetime64[ns]")
     ds = ds.assign_coords({TIME_NAME: times})
     return ds
 
@@ -159,7 +179,7 @@ def preserve_samples_per_batch(
         dataset_coord = None
 
     if dataset_coord is not None:
-        num_datasets = len(set(dataset_coord.values.tolist()))
+        num_datasets = np.unique(dataset_coord.values).size
         ds = ds.thin({SAMPLE_DIM_NAME: num_datasets})
 
     return ds
@@ -188,22 +208,17 @@ def shuffled(
     """
     chunks_default = (len(dataset[dim]),)
     chunks = dataset.chunks.get(dim, chunks_default)
-    chunk_indices = _get_chunk_indices(chunks)
-    shuffled_inds = np.concatenate(
-        [random.permutation(indices) for indices in chunk_indices]
-    )
+    # fill one preallocated index array rather than concatenating per-chunk ones
+    shuffled_inds = np.empty(sum(chunks), dtype=np.intp)
+    for indices in _get_chunk_indices(chunks):
+        shuffled_inds[indices] = random.permutation(indices)
 
     return dataset.isel({dim: shuffled_inds})
 
 
 def _get_chunk_indices(chunks):
-    indices = []
-
-    start = 0
-    for chunk in chunks:
-        indices.append(list(range(start, start + chunk)))
-        start += chunk
-    return indices
+    # split views of a single index array at the chunk boundaries
+    return np.split(np.arange(sum(chunks), dtype=np.intp), np.cumsum(chunks)[:-1])
 
 
 @curry
@@ -224,7 +239,7 @@ def subsample(
         dim (optional): dimension to sample along
     """
     dim_len = dataset.dims[dim]
-    sample_idx = random_state.choice(range(dim_len), num_samples, replace=False)
+    sample_idx = random_state.choice(dim_len, num_samples, replace=False)
     return dataset.isel({dim: sample_idx})
 
 
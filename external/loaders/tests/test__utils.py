@@ -1,3 +1,6 @@
+from datetime import datetime
+
+import cftime
 import numpy as np
 import pytest
 import xarray as xr
@@ -9,6 +12,7 @@ from loaders._utils import (
     preserve_samples_per_batch,
     nonderived_variables,
     subsample,
+    standardize_zarr_time_coord,
 )
 
 
@@ -127,7 +131,7 @@ def test__get_chunk_indices():
     chunks = (2, 3)
     expected = [[0, 1], [2, 3, 4]]
     ans = _get_chunk_indices(chunks)
-    assert ans == expected
+    assert [list(indices) for indices in ans] == expected
 
 
 def _stacked_dataset(sample_dim):
@@ -149,3 +153,32 @@ def test_shuffled():
 def test_shuffled_dask():
     dataset = _stacked_dataset("sample").chunk()
     shuffled(np.random.RandomState(1), dataset, dim="sample")
+
+
+def test_standardize_zarr_time_coord():
+    times = [
+        cftime.DatetimeJulian(2016, 8, 1, 0, 14, 59, 999990),
+        cftime.DatetimeJulian(2016, 8, 1, 0, 30, 0, 500000),
+        cftime.DatetimeJulian(2016, 8, 1, 23, 59, 59, 600000),
+    ]
+    ds = xr.Dataset({"a": (["time"], np.arange(3))}, coords={"time": times})
+    expected = np.array(
+        ["2016-08-01T00:15:00", "2016-08-01T00:30:00", "2016-08-02T00:00:00"],
+        dtype="datetime64[ns]",
+    )
+    result = standardize_zarr_time_coord(ds)
+    np.testing.assert_array_equal(result["time"].values, expected)
+    # datetime64 coordinates are rounded the same way
+    result = standardize_zarr_time_coord(ds.assign_coords(time=result["time"]))
+    np.testing.assert_array_equal(result["time"].values, expected)
+
+
+def test_standardize_zarr_time_coord_out_of_bounds_year():
+    times = [
+        cftime.DatetimeJulian(1, 1, 1, 0, 14, 59, 500001),
+        cftime.DatetimeJulian(1, 1, 1, 0, 30, 0, 400000),
+    ]
+    ds = xr.Dataset({"a": (["time"], np.arange(2))}, coords={"time": times})
+    expected = [datetime(1, 1, 1, 0, 15), datetime(1, 1, 1, 0, 30)]
+    result = standardize_zarr_time_coord(ds)
+    assert list(result["time"].values) == expected
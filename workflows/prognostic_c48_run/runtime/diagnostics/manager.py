@@ -103,16 +103,23 @@ class DiagnosticFile:
     def observe(
         self, time: cftime.DatetimeJulian, diagnostics: Mapping[str, xr.DataArray]
     ):
+        label = self.times.indicator(time)
+        if label is None:
+            # most timesteps are not output times, so return before doing any
+            # per-variable work
+            return
+
+        # units are invariant over a run, so only look them up the first time
+        # a variable is observed
         for key in diagnostics:
-            self._units[key] = diagnostics[key].attrs.get("units", "unknown")
+            if key not in self._units:
+                self._units[key] = diagnostics[key].attrs.get("units", "unknown")
 
-        label = self.times.indicator(time)
-        if label is not None:
-            if label != self._current_label:
-                self.flush()
-                self._reset_running_average(label, diagnostics)
-            else:
-                self._increment_running_average(diagnostics)
+        if label != self._current_label:
+            self.flush()
+            self._reset_running_average(label, diagnostics)
+        else:
+            self._increment_running_average(diagnostics)
 
     def _reset_running_average(self, label, diagnostics):
         self._running_total = {
@@ -123,20 +130,22 @@ class DiagnosticFile:
 
     def _increment_running_average(self, diagnostics):
         self._n += 1
-        for key in diagnostics:
-            if key in self.variables:
+        # the set of averaged variables is fixed when the average is reset, but
+        # a later step may not provide all of them
+        for key in self._running_total:
+            if key in diagnostics:
                 self._running_total[key] += diagnostics[key]
 
     def flush(self):
         if self._current_label is not None:
             average = {key: val / self._n for key, val in self._running_total.items()}
+            for key, val in average.items():
+                # need units for from_data_array to work. The averages are new
+                # arrays owned here, so set this in place rather than copying
+                val.attrs["units"] = self._units[key]
             quantities = {
-                # need units for from_data_array to work
-                key: fv3gfs.util.Quantity.from_data_array(
-                    average[key].assign_attrs(units=self._units[key])
-                )
-                for key in average
-                if key in self.variables
+                key: fv3gfs.util.Quantity.from_data_array(val)
+                for key, val in average.items()
             }
 
             # patch this in manually. the ZarrMonitor needs it.
@@ -35,8 +35,9 @@ class SelectedTimes(Container[cftime.DatetimeJulian]):
     def __init__(self, times=Sequence[str]):
         self._time_stamps = times
 
-        # see if there is an error
-        self.times
+        # parse the time stamps once, since membership is checked every timestep.
+        # This also raises early if any time stamp is malformed.
+        self._parsed_times = self.times
 
     @property
     def _times(self) -> Sequence[datetime.datetime]:
@@ -50,7 +51,7 @@ class SelectedTimes(Container[cftime.DatetimeJulian]):
         return [cftime.DatetimeJulian(*time.timetuple()) for time in self._times]
 
     def __contains__(self, time: cftime.DatetimeJulian) -> bool:
-        return time in self.times
+        return time in self._parsed_times
 
 
 class IntervalTimes(Container[cftime.DatetimeJulian]):
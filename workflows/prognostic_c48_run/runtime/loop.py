@@ -104,13 +104,13 @@ class LoggingMixin:
 
     rank: int
 
-    def _log_debug(self, message: str):
+    def _log_debug(self, message: str, *args):
         if self.rank == 0:
-            logger.debug(message)
+            logger.debug(message, *args)
 
-    def _log_info(self, message: str):
+    def _log_info(self, message: str, *args):
         if self.rank == 0:
-            logger.info(message)
+            logger.info(message, *args)
 
     def _print(self, message: str):
         if self.rank == 0:
@@ -253,13 +253,13 @@ class TimeLoop(Iterable[Tuple[cftime.DatetimeJulian, Diagnostics]], LoggingMixin
         self._fv3gfs.cleanup()
 
     def _step_dynamics(self) -> Diagnostics:
-        self._log_debug(f"Dynamics Step")
+        self._log_debug("Dynamics Step")
         self._fv3gfs.step_dynamics()
         # no diagnostics are computed by default
         return {}
 
     def _compute_physics(self) -> Diagnostics:
-        self._log_debug(f"Physics Step (compute)")
+        self._log_debug("Physics Step (compute)")
         self._fv3gfs.compute_physics()
         # no diagnostics are computed by default
         return {}
@@ -270,7 +270,7 @@ class TimeLoop(Iterable[Tuple[cftime.DatetimeJulian, Diagnostics]], LoggingMixin
         return [name for name in a if a[name]["is_water"]]
 
     def _apply_physics(self) -> Diagnostics:
-        self._log_debug(f"Physics Step (apply)")
+        self._log_debug("Physics Step (apply)")
         self._fv3gfs.apply_physics()
 
         micro = self._fv3gfs.get_diagnostic_by_name(
@@ -347,7 +347,7 @@ class TimeLoop(Iterable[Tuple[cftime.DatetimeJulian, Diagnostics]], LoggingMixin
         }
         self._state_updates = dissoc(self._state_updates, *prephysics_overrides)
         self._log_debug(
-            f"Applying prephysics state updates for: {list(state_updates.keys())}"
+            "Applying prephysics state updates for: %s", list(state_updates)
         )
         self._state.update_mass_conserving(state_updates)
 
@@ -358,7 +358,7 @@ class TimeLoop(Iterable[Tuple[cftime.DatetimeJulian, Diagnostics]], LoggingMixin
 
         Mostly used for updating the eastward and northward winds.
         """
-        self._log_debug(f"Apply postphysics tendencies to physics state")
+        self._log_debug("Apply postphysics tendencies to physics state")
         tendency = {k: v for k, v in self._tendencies.items() if k in ["dQu", "dQv"]}
 
         diagnostics: Diagnostics = {}
@@ -140,6 +140,26 @@ def test_DiagnosticFile_variable_units(attrs, expected_units):
     diag_file.flush()
 
 
+def test_DiagnosticFile_missing_variable_in_later_step():
+    t = datetime(2020, 1, 1)
+    both = {"a": xr.DataArray(1.0), "b": xr.DataArray(1.0)}
+    only_a = {"a": xr.DataArray(1.0)}
+
+    class StoringMonitor:
+        def store(self, state):
+            self.state = state
+
+    monitor = StoringMonitor()
+    diag_file = DiagnosticFile(
+        times=TimeContainer(All()), variables=["a", "b"], monitor=monitor
+    )
+    diag_file.observe(t, both)
+    diag_file.observe(t, only_a)
+    diag_file.flush()
+    assert float(monitor.state["a"].data_array) == 1.0
+    assert "b" in monitor.state
+
+
 def test_TimeContainer_indicator():
     t = datetime(2020, 1, 1)
     time_coord = TimeContainer([t])